@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Mapping
 from urllib.parse import urljoin
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DEFAULT_HEADERS: dict[str, str] = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
@@ -15,12 +18,16 @@ DEFAULT_HEADERS: dict[str, str] = {
     "Connection": "keep-alive",
 }
 
+POOL_SIZE = 32
+
+_WARNINGS_DISABLED = False
+
 
 class LoginError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoginConfig:
     host_url: str
     login_path: str
@@ -33,15 +40,22 @@ class LoginConfig:
     expected_statuses: tuple[int, ...] = (200, 204)
     disable_warnings: bool = False
 
+    def __post_init__(self) -> None:
+        _maybe_disable_warnings(self.disable_warnings, self.verify_ssl)
+
 
+@functools.lru_cache(maxsize=256)
 def _build_url(host_url: str, path: str) -> str:
     base = host_url.rstrip("/") + "/"
     return urljoin(base, path.lstrip("/"))
 
 
 def _maybe_disable_warnings(disable_warnings: bool, verify_ssl: bool) -> None:
-    if disable_warnings and not verify_ssl:
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    global _WARNINGS_DISABLED
+    if _WARNINGS_DISABLED or not (disable_warnings and not verify_ssl):
+        return
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    _WARNINGS_DISABLED = True
 
 
 def _response_excerpt(resp: requests.Response, limit: int = 200) -> str:
@@ -51,7 +65,15 @@ def _response_excerpt(resp: requests.Response, limit: int = 200) -> str:
 
 def create_session(config: LoginConfig) -> requests.Session:
     session = requests.Session()
-    session.headers.update(dict(config.headers))
+    session.headers.update(config.headers)
+    # Pooled keep-alive adapter: login, authenticated requests and logout share connections.
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     return session
 
 
@@ -78,7 +100,6 @@ def get_login_session(
     extra_payload: Mapping[str, Any] | None = None,
     session: requests.Session | None = None,
 ) -> requests.Session:
-    _maybe_disable_warnings(config.disable_warnings, config.verify_ssl)
     active_session = session or create_session(config)
     login_url = _build_url(config.host_url, config.login_path)
     payload = build_login_payload(user_id, password, config, extra_payload)
@@ -108,7 +129,6 @@ def logout(
     *,
     config: LoginConfig,
 ) -> requests.Response:
-    _maybe_disable_warnings(config.disable_warnings, config.verify_ssl)
     logout_url = _build_url(config.host_url, config.logout_path)
 
     try:
@@ -1,14 +1,22 @@
 import argparse
 import csv
+import functools
 import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Tuple
+from urllib.parse import urlparse
 
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -16,103 +24,241 @@ if str(ROOT_DIR) not in sys.path:
 
 from logging_utils import info, success, error, GREEN, RED, RESET
 
-MFA_KEYWORDS = ["mfa", "2fa", "otp", "authenticator", "verification code", "2-step", "2factor"]
+MFA_KEYWORDS = ("mfa", "2fa", "otp", "authenticator", "verification code", "2-step", "2factor")
 
+# Normalized once at import: lowercased, deduplicated, longest first so the
+# alternation stays a flat literal set however large the vocabulary grows.
+_MFA_TERMS = sorted(frozenset(k.lower() for k in MFA_KEYWORDS), key=len, reverse=True)
+_MFA_RE = re.compile(b"|".join(re.escape(t.encode()) for t in _MFA_TERMS), re.IGNORECASE)
+_MFA_OVERLAP = len(_MFA_TERMS[0]) - 1
 
-def safe_to_str(value) -> str:
-    if value is None:
-        return ""
-    try:
-        if isinstance(value, bytes):
-            return value.decode(errors="ignore")
-        return str(value)
-    except Exception:
-        return ""
+CHUNK_SIZE = 16384
+
+_MFA_DETECTED = f"Estimated MFA: {GREEN}Detected{RESET}"
+_MFA_NOT_DETECTED = f"Estimated MFA: {RED}Not Detected{RESET}"
+
+
+@dataclass(slots=True)
+class Cookie:
+    name: str
+    value: str | None
+    raw_header: str
+    secure: bool = False
+    httponly: bool = False
+    samesite: str | None = None
+    partitioned: bool = False
+    expires: str | None = None
+    max_age: str | None = None
+    domain: str | None = None
+    host_only: bool = False
+    path: str | None = None
+
+
+_ATTR_HANDLERS = {
+    "secure": lambda c, v: setattr(c, "secure", True),
+    "httponly": lambda c, v: setattr(c, "httponly", True),
+    "partitioned": lambda c, v: setattr(c, "partitioned", True),
+    "samesite": lambda c, v: setattr(c, "samesite", v or None),
+    "expires": lambda c, v: setattr(c, "expires", v or None),
+    "max-age": lambda c, v: setattr(c, "max_age", v or None),
+    "domain": lambda c, v: setattr(c, "domain", v or None),
+    "path": lambda c, v: setattr(c, "path", v or None),
+}
+# Servers almost always send the RFC 6265 spelling; matching it directly skips
+# lowercasing the token, which is only needed for unusual casings.
+_ATTR_HANDLERS.update(
+    (name, _ATTR_HANDLERS[name.lower()])
+    for name in ("Secure", "HttpOnly", "Partitioned", "SameSite", "Expires", "Max-Age", "Domain", "Path")
+)
+
+POOL_SIZE = 32
+# Distinct hosts whose keep-alive pools stay cached; a reused connection also
+# skips the DNS lookup for its host.
+HOST_POOLS = 64
+
+
+# Keep-alive pool shared by every scan so repeated hits on a host skip TCP/TLS setup.
+# pool_block: extra workers wait for a pooled connection instead of opening
+# throwaway ones that are discarded once the pool is full.
+_ADAPTER = HTTPAdapter(
+    pool_connections=HOST_POOLS,
+    pool_maxsize=POOL_SIZE,
+    pool_block=True,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
 
 
-def extract_all_cookies(resp) -> List[Dict]:
+def _create_session() -> requests.Session:
+    # A fresh Session per scan: its cookie jar must not carry cookies from an
+    # earlier scan, or servers that only set them once would not send them again.
+    # Not closed after use, as close() would also close the shared adapter.
+    session = requests.Session()
+    session.mount("http://", _ADAPTER)
+    session.mount("https://", _ADAPTER)
+    # Advertises br on top of gzip/deflate when brotli is installed (see requirements.txt).
+    session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+    return session
+
+
+@functools.lru_cache(maxsize=1024)
+def _host(url: str) -> str:
+    return urlparse(url).hostname or ""
+
+
+def _iter_attrs(header: str):
+    # Yields the ';'-separated attributes after the name=value pair without
+    # materializing the whole split list.
+    i = header.find(";") + 1
+    while i > 0:
+        j = header.find(";", i)
+        yield header[i:j] if j != -1 else header[i:]
+        i = j + 1
+
+
+def _parse_set_cookie(header: str, raw_header: str, host: str) -> Cookie:
+    # Single pass over the header: only the attribute names are lowercased.
+    end = header.find(";")
+    name, sep, value = (header if end == -1 else header[:end]).partition("=")
+    cookie = Cookie(
+        name=name.strip(),
+        value=value.strip() if sep else None,
+        raw_header=raw_header,
+    )
+    for part in _iter_attrs(header):
+        attr, _, attr_value = part.partition("=")
+        attr = attr.strip()
+        handler = _ATTR_HANDLERS.get(attr) or _ATTR_HANDLERS.get(attr.lower())
+        if handler is not None:
+            handler(cookie, attr_value.strip())
+    if cookie.domain is None:
+        # No Domain attribute: the cookie is bound to the host that set it.
+        cookie.domain = host
+        cookie.host_only = True
+    return cookie
+
+
+def extract_all_cookies(resp) -> List[Cookie]:
+    # resp.headers folds repeated Set-Cookie headers into one comma-joined value;
+    # urllib3's header dict on resp.raw yields each occurrence separately.
+    headers = resp.raw.headers if resp.raw is not None else resp.headers
+    # resp.url is the post-redirect URL, i.e. the host that actually set the cookies.
+    host = _host(resp.url)
     cookies = []
-    for key, value in resp.headers.items():
+    for key, value in headers.items():
         if "cookie" in key.lower():
-            header_str = safe_to_str(value)
-            parts = [p.strip() for p in header_str.split(";")]
-            for part in parts:
-                if "=" in part:
-                    k, v = part.split("=", 1)
-                    cookies.append({
-                        "name": k.strip(),
-                        "value": v.strip(),
-                        "raw_header": key,
-                    })
-                else:
-                    cookies.append({
-                        "name": part,
-                        "value": None,
-                        "raw_header": key,
-                    })
+            cookies.append(_parse_set_cookie(value, key, host))
     return cookies
 
 
 def detect_mfa(resp) -> bool:
-    body = safe_to_str(resp.text).lower()
-    if any(k in body for k in MFA_KEYWORDS):
-        return True
-    if "location" in resp.headers:
-        loc = safe_to_str(resp.headers["Location"]).lower()
-        if any(k in loc for k in MFA_KEYWORDS):
+    # Redirects already in memory answer the common "302 -> /mfa" case without
+    # touching the body.
+    for r in (*resp.history, resp):
+        if _MFA_RE.search(r.headers.get("Location", "").encode("latin-1", "ignore")):
+            return True
+    if resp.is_redirect:
+        return False
+
+    # Stream the raw body bytes and stop at the first hit; the keywords are
+    # ASCII, so no decoding is needed. Keep a short tail so a keyword split
+    # across two chunks is still found.
+    tail = b""
+    for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+        # Search the chunk in place; only the small boundary window is concatenated.
+        if _MFA_RE.search(tail + chunk[:_MFA_OVERLAP]) or _MFA_RE.search(chunk):
             return True
+        tail = (tail + chunk[-_MFA_OVERLAP:])[-_MFA_OVERLAP:]
     return False
 
 
-def scan_url(url: str, timeout: float = 5.0) -> Tuple[List[Dict], bool]:
+def scan_url(url: str, timeout: float = 5.0) -> Tuple[List[Cookie], bool]:
     try:
-        resp = requests.get(url, timeout=timeout, allow_redirects=True, verify=False)
+        with _create_session().get(url, timeout=timeout, allow_redirects=True, verify=False, stream=True) as resp:
+            # Cookies come from the headers, so they are parsed before any body is read.
+            cookies_info = extract_all_cookies(resp)
+            mfa = detect_mfa(resp)
     except Exception as e:
         error(f"요청 실패: {e}")
         return [], False
 
-    cookies_info = extract_all_cookies(resp)
-    mfa = detect_mfa(resp)
     return cookies_info, mfa
 
 
-def scan_and_render(url: str, *, timeout: float = 5.0) -> Tuple[List[Dict], bool]:
-    info(f"Checking Cookie & MFA for {url}")
+def scan_urls(urls: List[str], *, timeout: float = 5.0, max_workers: int = POOL_SIZE) -> List[Tuple[str, List[Cookie], bool]]:
+    # Network-bound: fan out over the shared connection pool.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        results_iter = executor.map(functools.partial(scan_url, timeout=timeout), urls)
+    return [(url, cookies, mfa) for url, (cookies, mfa) in zip(urls, results_iter)]
 
-    cookies, mfa = scan_url(url, timeout=timeout)
 
+def render(url: str, cookies: List[Cookie], mfa: bool) -> None:
     print()
     success(f"Target: {url}")
     success(f"Cookies found: {len(cookies)}")
     for c in cookies:
-        print(f"{GREEN}- {c['name']}{RESET}")
-        print(f"    value       = {c['value']}")
-        print(f"    raw_header  = {c['raw_header']}")
+        print(f"{GREEN}- {c.name}{RESET}")
+        print(f"    value       = {c.value}")
+        print(f"    raw_header  = {c.raw_header}")
+        print(f"    secure      = {c.secure}")
+        print(f"    httponly    = {c.httponly}")
+        print(f"    samesite    = {c.samesite}")
         print()
-    mfa_status = f"{GREEN}Detected{RESET}" if mfa else f"{RED}Not Detected{RESET}"
-    success(f"Estimated MFA: {mfa_status}", colored=False)
+    success(_MFA_DETECTED if mfa else _MFA_NOT_DETECTED, colored=False)
+
+
+def scan_and_render(url: str, *, timeout: float = 5.0) -> Tuple[List[Cookie], bool]:
+    info(f"Checking Cookie & MFA for {url}")
+
+    cookies, mfa = scan_url(url, timeout=timeout)
+    render(url, cookies, mfa)
 
     return cookies, mfa
 
 
-def save_json(path: str, cookies: List[Dict], mfa: bool):
+def to_output(results: List[Tuple[str, List[Cookie], bool]]):
+    # A single URL keeps the original flat layout.
+    if len(results) == 1:
+        _, cookies, mfa = results[0]
+        return {"cookies": [asdict(c) for c in cookies], "mfa_detected": mfa}
+    return [
+        {"url": url, "cookies": [asdict(c) for c in cookies], "mfa_detected": mfa}
+        for url, cookies, mfa in results
+    ]
+
+
+def to_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def save_json(path: str, data, *, text: str | None = None):
+    # Callers that already serialized the data pass it as text to skip a second encode.
     with open(path, "w", encoding="utf-8") as f:
-        json.dump({"cookies": cookies, "mfa_detected": mfa}, f, ensure_ascii=False, indent=2)
+        f.write(to_json(data) if text is None else text)
+
+# Write buffer for the CSV report; csv.writer issues one write() per row.
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FIELDS = ["name", "value", "raw_header", "domain", "host_only", "path", "secure", "httponly", "samesite", "expires", "max_age", "partitioned"]
+
 
-def save_csv(path: str, cookies: List[Dict], mfa: bool):
-    with open(path, "w", newline="", encoding="utf-8") as f:
+def save_csv(path: str, results: List[Tuple[str, List[Cookie], bool]]):
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
         w = csv.writer(f)
-        w.writerow(["name", "value", "raw_header"])
-        for c in cookies:
-            w.writerow([c["name"], c["value"], c["raw_header"]])
+        w.writerow(["url", *CSV_FIELDS])
+        w.writerows(
+            [url, *(getattr(c, field) for field in CSV_FIELDS)]
+            for url, cookies, _ in results
+            for c in cookies
+        )
         w.writerow([])
-        w.writerow(["MFA Detected", mfa])
+        w.writerow(["url", "MFA Detected"])
+        w.writerows([url, mfa] for url, _, mfa in results)
 
 
 def parse_args(argv: List[str]):
     p = argparse.ArgumentParser(description="All Cookies + MFA Scanner")
-    p.add_argument("url", help="Target URL (ex: https://example.com/login)")
+    p.add_argument("url", nargs="+", help="Target URL(s) (ex: https://example.com/login)")
     p.add_argument("--timeout", type=float, default=5.0, help="Request timeout (seconds)")
+    p.add_argument("--workers", type=int, default=POOL_SIZE, help="Concurrent requests when scanning multiple URLs")
 
     out = p.add_mutually_exclusive_group()
     out.add_argument("--json", action="store_true", help="Output results as JSON")
@@ -122,25 +268,29 @@ def parse_args(argv: List[str]):
 
 def main(argv: List[str]) -> int:
     args = parse_args(argv)
-    url = args.url
+    urls = args.url
 
-    if args.json:
+    for url in urls:
         info(f"Checking Cookie & MFA for {url}")
-        cookies, mfa = scan_url(url, timeout=args.timeout)
+    results = scan_urls(urls, timeout=args.timeout, max_workers=args.workers)
+
+    if args.json:
+        data = to_output(results)
+        # Serialize once; the file and stdout get the same text.
+        text = to_json(data)
         if args.output:
-            save_json(args.output, cookies, mfa)
-        print(json.dumps({"cookies": cookies, "mfa_detected": mfa}, ensure_ascii=False, indent=2))
+            save_json(args.output, data, text=text)
+        print(text)
     elif args.csv:
-        info(f"Checking Cookie & MFA for {url}")
-        cookies, mfa = scan_url(url, timeout=args.timeout)
         if args.output:
-            save_csv(args.output, cookies, mfa)
+            save_csv(args.output, results)
         else:
             success("CSV output requires --output option.", colored=False)
     else:
-        cookies, mfa = scan_and_render(url, timeout=args.timeout)
+        for url, cookies, mfa in results:
+            render(url, cookies, mfa)
         if args.output:
-            save_json(args.output, cookies, mfa)
+            save_json(args.output, to_output(results))
             success(f"JSON saved: {args.output}")
 
     return 0
@@ -1,7 +1,11 @@
 import re
 import sys
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from typing import Any
 
@@ -14,27 +18,49 @@ if str(ROOT_DIR) not in sys.path:
 from logging_utils import info, success, error
 
 
+# Patterns are written so the engine cannot backtrack quadratically on long
+# runs (base64 blobs, slash chains) and every match has a bounded length:
+# emails only start at the beginning of a run (lookbehind), all repeats are
+# bounded, and JWT segments cannot contain '.'.
 PATTERNS: Dict[str, str] = {
-    "Email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-z]{2,}",
+    "Email": r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-z]{2,63}",
     "AWS Key": r"AKIA[0-9A-Z]{16}",
-    "JWT Token": r"eyJ[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9._-]{10,}\.[a-zA-Z0-9._-]{10,}",
-    "File Path": r"(\/[a-zA-Z0-9_\-]+)+\.[a-zA-Z]{2,4}",
-    "Error Message": r"(Exception|Traceback|SQL syntax|ORA-\d+|Warning:)"
+    "JWT Token": r"eyJ[a-zA-Z0-9_-]{10,2048}\.[a-zA-Z0-9_-]{10,2048}\.[a-zA-Z0-9_-]{10,2048}",
+    "File Path": r"(?:/[a-zA-Z0-9_\-]{1,64}){1,20}\.[a-zA-Z]{2,4}",
+    "Error Message": r"(?:Exception|Traceback|SQL syntax|ORA-\d{1,10}|Warning:)"
 }
 
+# Each pattern runs its own finditer, so findings of different types may
+# overlap ("Exception" inside /srv/app/Exception.log is both a file path and
+# an error message). One fused alternation would consume the text and drop one.
+_COMPILED_PATTERNS: Dict[str, re.Pattern] = {name: re.compile(pattern) for name, pattern in PATTERNS.items()}
+
+# Non-capturing so findall returns the whole version ("1.18.0"), not the group.
+_VERSION_RE = re.compile(r"\d+\.\d+(?:\.\d+)?")
+
 REQUEST_TIMEOUT: int = 10
 MAX_MATCHES_DISPLAY: int = 3
+STREAM_CHUNK_SIZE: int = 65536
+# Longest possible match of any pattern, plus one char: an attempt starting
+# MATCH_OVERLAP chars before the end of the window never reads past it, so
+# its outcome cannot change when the next chunk arrives.
+MATCH_OVERLAP: int = max(_sre_parse.parse(p).getwidth()[1] for p in PATTERNS.values()) + 1
+if MATCH_OVERLAP > _sre_parse.MAXREPEAT:
+    raise ValueError("every exposure pattern needs a bounded match length")
+# Text kept before the resume position for the patterns' lookbehinds.
+LOOKBEHIND_CONTEXT: int = 64
 
 
 def extract_headers_info(resp: requests.Response) -> List[Dict[str, Any]]:
     header_infos: List[Dict[str, Any]] = []
     for key, value in resp.headers.items():
-        if "server" in key.lower() or "powered" in key.lower():
+        key_l = key.lower()
+        if "server" in key_l or "powered" in key_l:
             value_str = str(value)
             success(f"Header Info: {key}: {value_str}")
 
             # 버전 정보 추출
-            versions = re.findall(r"\d+\.\d+(\.\d+)?", value_str)
+            versions = _VERSION_RE.findall(value_str)
             if versions:
                 success(f"{key} Version Info: {', '.join(versions)}")
 
@@ -46,6 +72,41 @@ def extract_headers_info(resp: requests.Response) -> List[Dict[str, Any]]:
     return header_infos
 
 
+def _scan_exposures(chunks: Iterable[str]) -> Dict[str, List[str]]:
+    # Regex over a sliding window instead of the whole body, with the same
+    # matches as one finditer per pattern over the whole body. Only matches
+    # starting before the last MATCH_OVERLAP chars are taken each round; later
+    # ones wait for the next chunk, so a token cut by a chunk boundary is still
+    # found once. Each pattern resumes with finditer(buffer, pos) so its
+    # lookbehind still sees the LOOKBEHIND_CONTEXT chars kept before pos.
+    matches: Dict[str, List[str]] = {name: [] for name in _COMPILED_PATTERNS}
+    positions = dict.fromkeys(_COMPILED_PATTERNS, 0)
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        settled = len(buffer) - MATCH_OVERLAP
+        if settled <= 0:
+            continue
+        for name, regex in _COMPILED_PATTERNS.items():
+            pos = positions[name]
+            for m in regex.finditer(buffer, pos):
+                if m.start() >= settled:
+                    break
+                matches[name].append(m.group())
+                pos = m.end()
+            # No match starts between the last one and `settled`, and no later
+            # chunk can add one there.
+            positions[name] = max(pos, settled)
+        trim = max(0, min(positions.values()) - LOOKBEHIND_CONTEXT)
+        buffer = buffer[trim:]
+        for name in positions:
+            positions[name] -= trim
+
+    for name, regex in _COMPILED_PATTERNS.items():
+        matches[name].extend(m.group() for m in regex.finditer(buffer, positions[name]))
+    return {name: found for name, found in matches.items() if found}
+
+
 def normalize_url(url: str) -> str:
     if not url.startswith("http://") and not url.startswith("https://"):
         return f"http://{url}"
@@ -66,22 +127,26 @@ def scan(url: str) -> Dict[str, Any]:
 
     try:
         headers = {"User-Agent": "Mozilla/5.0 (compatible; VCLAS/1.0)"}
-        resp = requests.get(normalized_url, headers=headers, timeout=REQUEST_TIMEOUT)
-        success(f"Status Code: {resp.status_code}")
+        with requests.get(normalized_url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+            success(f"Status Code: {resp.status_code}")
+
+            result["status_code"] = resp.status_code
 
-        result["status_code"] = resp.status_code
+            if resp.status_code >= 400:
+                msg = f"HTTP Error: {resp.status_code} - {resp.reason}"
+                error(msg)
+                result["error"] = msg
+                return result
 
-        if resp.status_code >= 400:
-            msg = f"HTTP Error: {resp.status_code} - {resp.reason}"
-            error(msg)
-            result["error"] = msg
-            return result
+            result["header_infos"] = extract_headers_info(resp)
 
-        result["header_infos"] = extract_headers_info(resp)
-        body = resp.text
+            # Undeclared charsets would otherwise make iter_content yield bytes.
+            if resp.encoding is None:
+                resp.encoding = "utf-8"
+            found = _scan_exposures(resp.iter_content(chunk_size=STREAM_CHUNK_SIZE, decode_unicode=True))
 
-        for name, pattern in PATTERNS.items():
-            matches: List[str] = re.findall(pattern, body)
+        for name in PATTERNS:
+            matches = found.get(name)
             if matches:
                 success(f"{name} Exposure Detected: {matches[:MAX_MATCHES_DISPLAY]}")
                 result["exposures"][name] = matches
@@ -1,7 +1,11 @@
 import requests
+import secrets
+import socket
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, urlsplit
 from typing import Any
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -54,11 +58,116 @@ misc_paths = [
 ]
 
 
+POOL_SIZE = 32
+# Largest fallback GET body read just to keep its connection alive.
+DRAIN_LIMIT = 16384
+# Same-path redirect hops (http -> https, www.) followed per probe.
+MAX_REDIRECTS = 5
+
 dir_paths = {"admin":admin_paths, "site_map":site_map_paths, "server":server_paths, "settings":settings_paths, "misc":misc_paths}
 
+# Some paths (login/, wp-admin/, config.php, ...) are listed in more than one
+# category; probe each once and keep it under the first category listing it.
+_seen_paths: set[str] = set()
+for _category, _path_list in dir_paths.items():
+    dir_paths[_category] = [p for p in dict.fromkeys(_path_list) if p not in _seen_paths]
+    _seen_paths.update(dir_paths[_category])
+del _seen_paths, _category, _path_list
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    # Keep-alive pools for the base host plus a few redirect targets (http -> https,
+    # www.), so redirected probes do not evict the base host's connections.
+    # pool_block: a worker waits for a pooled connection instead of opening an
+    # overflow one that is closed right after use and left in TIME_WAIT.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _is_reachable(base_url: str, timeout: float) -> bool:
+    # One TCP connect to the base host: when it is down, every probe would fail
+    # anyway after its own connect attempt/timeout.
+    if requests.utils.get_environ_proxies(base_url):
+        return True  # Traffic goes through a proxy; a direct connect says nothing.
+    parsed = urlparse(base_url)
+    if not parsed.hostname:
+        return True
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    except ValueError:
+        return False  # Non-numeric or out-of-range port: nothing to connect to.
+    try:
+        with socket.create_connection((parsed.hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _probe(session: requests.Session, url: str, timeout: float) -> requests.Response:
+    # Only the status line matters, so skip the body: HEAD first, and for servers
+    # that reject HEAD a streamed GET that is closed before the body is read.
+    response = session.head(url, timeout=timeout, allow_redirects=False)
+    if response.status_code in (405, 501):
+        response = session.get(url, timeout=timeout, allow_redirects=False, stream=True)
+        # Closing an unread body drops the connection; a small one is cheaper to
+        # drain so the keep-alive connection goes back to the pool.
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) <= DRAIN_LIMIT:
+            for _ in response.iter_content(8192):
+                pass
+        response.close()
+    return response
+
+
+def _same_resource(url: str, target: str) -> bool:
+    # http -> https and host -> www. redirects keep the path: they move the
+    # resource, they do not say whether it exists.
+    a, b = urlsplit(url), urlsplit(target)
+    return (a.path or "/", a.query) == (b.path or "/", b.query)
+
+
+def _probe_status(session: requests.Session, url: str, timeout: float) -> int:
+    # A redirect to the same path on another scheme/host is followed and the
+    # path is judged by where it lands; any other 3xx (admin/ -> login) is
+    # itself the answer for the path.
+    for _ in range(MAX_REDIRECTS + 1):
+        response = _probe(session, url, timeout)
+        location = response.headers.get("Location")
+        if not (300 <= response.status_code < 400 and location):
+            break
+        target = urljoin(url, location)
+        if not _same_resource(url, target):
+            break
+        url = target
+    return response.status_code
+
+
+def _detect_catch_all(session: requests.Session, base_url: str, timeout: float) -> int | None:
+    # Two random paths that cannot exist: if both get a "found" status, the
+    # server answers everything (soft 404 / SPA fallback, or a redirect of every
+    # path to a login page) and every probe would be reported as found. Uses the
+    # probes' own redirect policy, so both judge the same thing. Returns that
+    # status, or None.
+    for suffix in ("/", ".php"):
+        url = urljoin(base_url, f"{secrets.token_hex(8)}{suffix}")
+        try:
+            status = _probe_status(session, url, timeout)
+        except requests.RequestException:
+            return None
+        if not 200 <= status < 400:
+            return None
+    return status
+
+
+def _build_probe_urls(base_url: str, paths: dict[str, list[str]]) -> dict[str, list[tuple[str, str]]]:
+    # urljoin once per path per scan; the unreachable report and the probes share the result.
+    return {category: [(path, urljoin(base_url, path)) for path in path_list] for category, path_list in paths.items()}
 
 
-def scan(base_url: str, paths: dict[str, list[str]] = dir_paths, *, timeout: float = 5.0) -> dict[str, Any]:
+def scan(base_url: str, paths: dict[str, list[str]] = dir_paths, *, timeout: float = 5.0, max_workers: int = POOL_SIZE) -> dict[str, Any]:
     info(f"Base Url: {base_url}")
     info(f"{base_url} Information scrapping start.")
 
@@ -66,51 +175,97 @@ def scan(base_url: str, paths: dict[str, list[str]] = dir_paths, *, timeout: flo
         "base_url": base_url,
         "timeout": timeout,
         "categories": [],
+        "catch_all": None,
+        "skipped": None,
     }
 
-    for category, path_list in paths.items():
-        info(f"Checking paths in category '{category}' with {len(path_list)} entries...")
-        results = []
-
-        category_result: dict[str, Any] = {
-            "category": category,
-            "checked": len(path_list),
-            "found": [],
-            "errors": [],
-        }
-
-        for path in path_list:
-            url = urljoin(base_url, path)
-            try:
-                response = requests.get(url, timeout=timeout)
-                if response.status_code == 200:
-                    results.append(f"{GREEN}[+] {path}:\tResponse exist (200 OK){RESET}")
-                    category_result["found"].append(
+    probe_urls = _build_probe_urls(base_url, paths)
+
+    if not _is_reachable(base_url, timeout):
+        msg = f"{base_url} is unreachable; skipped path probes"
+        error(msg)
+        scan_result["skipped"] = msg
+        for category, path_urls in probe_urls.items():
+            scan_result["categories"].append(
+                {
+                    "category": category,
+                    "checked": len(path_urls),
+                    "found": [],
+                    "errors": [{"path": path, "url": url, "error": msg} for path, url in path_urls],
+                }
+            )
+        return scan_result
+
+    with _create_session() as session:
+        catch_all = _detect_catch_all(session, base_url, timeout)
+        if catch_all is not None:
+            # Brute force would only list every path with the same status.
+            msg = f"{base_url} answers random nonexistent paths with {catch_all} (catch-all); skipped path probes"
+            error(msg)
+            scan_result["catch_all"] = catch_all
+            scan_result["skipped"] = msg
+            for category in paths:
+                scan_result["categories"].append(
+                    {"category": category, "checked": 0, "found": [], "errors": []}
+                )
+            return scan_result
+
+        _scan_paths(session, probe_urls, scan_result, timeout=timeout, max_workers=max_workers)
+
+    return scan_result
+
+
+def _scan_paths(session: requests.Session, probe_urls: dict[str, list[tuple[str, str]]], scan_result: dict[str, Any], *, timeout: float, max_workers: int) -> None:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit every probe up front so all categories share the worker pool;
+        # results are still read back in category/path order.
+        pending: dict[str, list[tuple[str, str, Future]]] = {}
+        for category, path_urls in probe_urls.items():
+            probes = pending.setdefault(category, [])
+            for path, url in path_urls:
+                probes.append((path, url, executor.submit(_probe_status, session, url, timeout)))
+
+        for category, probes in pending.items():
+            info(f"Checking paths in category '{category}' with {len(probes)} entries...")
+            results = []
+
+            category_result: dict[str, Any] = {
+                "category": category,
+                "checked": len(probes),
+                "found": [],
+                "errors": [],
+            }
+
+            for path, url, future in probes:
+                try:
+                    status = future.result()
+                    # Only same-path redirects are followed, so 3xx (e.g. admin/ -> login) counts too.
+                    if 200 <= status < 400:
+                        results.append(f"{GREEN}[+] {path}:\tResponse exist ({status}){RESET}")
+                        category_result["found"].append(
+                            {
+                                "path": path,
+                                "url": url,
+                                "status_code": status,
+                            }
+                        )
+                except requests.RequestException as e:
+                    results.append(f"{RED}[-] {path}: Request Failed{RESET}")
+
+                    # Keep the error details for the dashboard report.
+                    category_result["errors"].append(
                         {
                             "path": path,
                             "url": url,
-                            "status_code": response.status_code,
+                            "error": str(e),
                         }
                     )
-            except requests.RequestException as e:
-                results.append(f"{RED}[-] {path}: Request Failed{RESET}")
-
-                # Keep the error details for the dashboard report.
-                category_result["errors"].append(
-                    {
-                        "path": path,
-                        "url": url,
-                        "error": str(e),
-                    }
-                )
-        if len(results) == 0:
-            error("No interesting directories or files found.")
-        else:
-            print("\n".join(results))
-
-        scan_result["categories"].append(category_result)
+            if len(results) == 0:
+                error("No interesting directories or files found.")
+            else:
+                print("\n".join(results))
 
-    return scan_result
+            scan_result["categories"].append(category_result)
 
 
 def main(base_url: str, paths: dict[str, list[str]] = dir_paths):
@@ -1,9 +1,15 @@
+import argparse
+import asyncio
+import functools
+import hashlib
+import ipaddress
+import json
+import os
+import random
 import socket
 import sys
-import subprocess
-import re
+import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
 
 from typing import Any
 
@@ -14,65 +20,188 @@ if str(ROOT_DIR) not in sys.path:
 from logging_utils import info, success, error, GREEN, RED, RESET
 
 PORTS = range(1,1025)
-NSLOOKUP_TIMEOUT_SECONDS = 10.0
+RESOLVE_ATTEMPTS = 2
+# Concurrent connects in flight; each holds a file descriptor, so this stays
+# well under the common 1024 open-files limit.
+MAX_CONCURRENCY = 512
+# Per-connect timeout when no RTT sample is available.
+DEFAULT_PORT_TIMEOUT = 0.5
+# Adaptive timeout: RTT_TIMEOUT_FACTOR x the measured RTT, clamped to this range.
+MIN_PORT_TIMEOUT = 0.05
+MAX_PORT_TIMEOUT = 2.0
+RTT_TIMEOUT_FACTOR = 3
+# Ports used to sample RTT; a refused connect (RST) is as good a sample as an accept.
+RTT_PROBE_PORTS = (80, 443, 22)
+RTT_PROBE_TIMEOUT = 1.0
+DNS_CACHE_TTL_SECONDS = 900
+PORT_SCAN_CACHE_TTL_SECONDS = 600
 
-def scan_port(port: int, target: str, *, timeout: float = 0.5) -> int | None:
+DNS_CACHE_PATH = ROOT_DIR / "data" / "cache" / "dns_cache.json"
+PORT_SCAN_CACHE_PATH = ROOT_DIR / "data" / "cache" / "portscan_cache.json"
+# Cached results are only valid for the same port list.
+_PORTS_HASH = hashlib.blake2b(str(list(PORTS)).encode(), digest_size=8).hexdigest()
+
+async def scan_port_async(ip: str, port: int, sem: asyncio.Semaphore, timeout: float) -> int | None:
+    async with sem:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        writer.close()
+        return port
+
+
+async def _connect_rtt(ip: str, port: int) -> float | None:
+    start = time.monotonic()
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((target, port))
-        sock.close()
-        if result == 0:
-            return port
-    except Exception:
-        pass
-    return None
-
-def _run_nslookup(target: str, *, timeout: float = NSLOOKUP_TIMEOUT_SECONDS) -> str:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), RTT_PROBE_TIMEOUT)
+    except ConnectionRefusedError:
+        return time.monotonic() - start
+    except (OSError, asyncio.TimeoutError):
+        return None
+    rtt = time.monotonic() - start
+    writer.close()
+    return rtt
+
+
+async def _estimate_timeout(ip: str) -> float:
+    # Like Nmap's initial RTT estimate: a LAN host needs far less than the fixed
+    # default per closed port, a distant one needs more to not miss open ports.
+    # Averages the probes that answered (the first answer alone is the fastest,
+    # too tight once the scan's connects queue up); none keeps the default.
+    samples = [rtt for rtt in await asyncio.gather(*(_connect_rtt(ip, port) for port in RTT_PROBE_PORTS)) if rtt is not None]
+    if not samples:
+        return DEFAULT_PORT_TIMEOUT
+    rtt = sum(samples) / len(samples)
+    return min(MAX_PORT_TIMEOUT, max(MIN_PORT_TIMEOUT, RTT_TIMEOUT_FACTOR * rtt))
+
+
+async def _scan_ip(ip: str, sem: asyncio.Semaphore, timeout: float | None) -> list[int]:
+    if timeout is None:
+        timeout = await _estimate_timeout(ip)
+        info(f"Port timeout for {ip}: {timeout * 1000:.0f} ms")
+    ports = await asyncio.gather(*(scan_port_async(ip, port, sem, timeout) for port in PORTS))
+    return [port for port in ports if port]
+
+
+async def _scan_all(ip_addrs: list[str], *, max_concurrency: int, timeout: float | None) -> dict[str, list[int]]:
+    # One event loop drives every (ip, port) connect; the semaphore bounds how
+    # many are in flight instead of a fixed number of blocked threads.
+    sem = asyncio.Semaphore(max_concurrency)
+    per_ip = await asyncio.gather(*(_scan_ip(ip, sem, timeout) for ip in ip_addrs))
+    return dict(zip(ip_addrs, per_ip))
+
+def _load_cache(path: Path) -> dict[str, Any]:
     try:
-        proc = subprocess.run(
-            ["nslookup", target],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-    except FileNotFoundError as exc:
-        raise RuntimeError("nslookup command not found") from exc
-    except subprocess.TimeoutExpired as exc:
-        raise RuntimeError(f"nslookup timeout after {timeout}s") from exc
-
-    output = (proc.stdout or "") + ("\n" + proc.stderr if proc.stderr else "")
-    return output.strip()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
-def get_ip_addr(target: str) -> list[str]:
-    info(f"nslookup {target} ...")
-    output = _run_nslookup(target)
+def _cache_get(path: Path, key: str) -> dict[str, Any] | None:
+    entry = _load_cache(path).get(key)
+    if not isinstance(entry, dict) or entry.get("expires", 0) < time.time():
+        return None
+    return entry
+
+
+def _cache_put(path: Path, entries: dict[str, dict[str, Any]], ttl: float) -> None:
+    # Merge into the file (dropping expired entries) and replace it atomically.
+    now = time.time()
+    data = {key: entry for key, entry in _load_cache(path).items()
+            if isinstance(entry, dict) and entry.get("expires", 0) >= now}
+    data.update((key, {**entry, "expires": now + ttl}) for key, entry in entries.items())
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        error(f"Could not write cache {path.name}: {exc}", colored=False)
+
+
+def _cached_addrs(target: str) -> tuple[str, ...] | None:
+    entry = _cache_get(DNS_CACHE_PATH, target)
+    addrs = entry.get("addrs") if entry else None
+    return tuple(str(a) for a in addrs) if isinstance(addrs, list) and addrs else None
+
+
+def _store_addrs(target: str, addrs: tuple[str, ...]) -> None:
+    # Reruns and the other tools in the pipeline reuse the answer for the TTL.
+    _cache_put(DNS_CACHE_PATH, {target: {"addrs": list(addrs)}}, DNS_CACHE_TTL_SECONDS)
 
-    # Original implementation parsed only the non-authoritative answer section.
-    text = output
-    if "Non-authoritative answer:" in output:
+
+def _port_cache_key(ip: str) -> str:
+    return f"{ip}/{_PORTS_HASH}"
+
+
+def _cached_open_ports(ip: str) -> list[int] | None:
+    entry = _cache_get(PORT_SCAN_CACHE_PATH, _port_cache_key(ip))
+    ports = entry.get("ports") if entry else None
+    return [int(p) for p in ports] if isinstance(ports, list) else None
+
+
+def _store_open_ports(open_by_ip: dict[str, list[int]]) -> None:
+    _cache_put(
+        PORT_SCAN_CACHE_PATH,
+        {_port_cache_key(ip): {"ports": ports} for ip, ports in open_by_ip.items()},
+        PORT_SCAN_CACHE_TTL_SECONDS,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_ipv4(target: str) -> tuple[str, ...]:
+    # In-process resolver lookup; no nslookup process or output parsing per host.
+    # Successful answers are memoized for the run (failures are not cached) and
+    # kept on disk for DNS_CACHE_TTL_SECONDS.
+    try:
+        return (str(ipaddress.IPv4Address(target)),)
+    except ValueError:
+        pass  # Not an IPv4 literal; ask the resolver.
+    cached = _cached_addrs(target)
+    if cached is not None:
+        return cached
+    for attempt in range(RESOLVE_ATTEMPTS):
         try:
-            text = output.split("Non-authoritative answer:", 1)[1]
-        except Exception:
-            text = output
+            infos = socket.getaddrinfo(target, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+            break
+        except socket.gaierror as exc:
+            # Only a temporary failure (e.g. a dropped UDP answer) is worth a retry.
+            if exc.errno != socket.EAI_AGAIN or attempt == RESOLVE_ATTEMPTS - 1:
+                raise RuntimeError(f"DNS resolution failed: {exc}") from exc
+            time.sleep(0.1 + random.random() * 0.05)
+    addrs = tuple(dict.fromkeys(sockaddr[0] for _, _, _, _, sockaddr in infos))
+    if addrs:
+        _store_addrs(target, addrs)
+    return addrs
+
 
+def get_ip_addr(target: str) -> list[str]:
+    info(f"Resolving {target} ...")
     # We currently scan with IPv4 sockets; keep only IPv4 addresses.
-    addresses = re.findall(r"Address:\s+(\d+\.\d+\.\d+\.\d+)", text)
+    addresses = _resolve_ipv4(target)
     # Deduplicate while preserving order.
-    seen: set[str] = set()
-    unique_addrs: list[str] = []
-    for addr in addresses:
-        if addr in seen:
-            continue
-        seen.add(addr)
-        unique_addrs.append(addr)
+    unique_addrs = list(dict.fromkeys(addresses))
 
     print(f"Found IP addresses: {unique_addrs}")
     return unique_addrs
 
-def scan_target(target: str, *, max_workers: int = 100, port_timeout: float = 0.5) -> dict[str, Any]:
+def _one_per_subnet(ip_addrs: list[str]) -> list[str]:
+    # CDN/anycast hosts resolve to several addresses in one /24 that front the
+    # same edge; scanning the first of each /24 gives the same answer.
+    buckets: dict[str, str] = {}
+    for ip in ip_addrs:
+        buckets.setdefault(ip.rsplit(".", 1)[0], ip)
+    return list(buckets.values())
+
+
+def scan_target(target: str, *, max_workers: int = MAX_CONCURRENCY, port_timeout: float | None = None, use_cache: bool = True, all_ips: bool = False) -> dict[str, Any]:
+    # port_timeout=None derives the per-connect timeout from each address's RTT.
+    # use_cache reuses an address's open ports from the last PORT_SCAN_CACHE_TTL_SECONDS.
+    # all_ips=False scans one address per /24; the others are listed but not scanned.
     info(f"Port Scanning Start ... 1 ~ 1024 ports for {target}")
 
     result: dict[str, Any] = {
@@ -91,17 +220,28 @@ def scan_target(target: str, *, max_workers: int = 100, port_timeout: float = 0.
         result["error"] = msg
         return result
 
-    for ip in ip_addrs:
-        success(f"Scanning {ip} ...")
+    if not all_ips:
+        scan_ips = _one_per_subnet(ip_addrs)
+        if len(scan_ips) < len(ip_addrs):
+            info(f"Scanning one address per /24: {scan_ips} (use --all-ips to scan all)")
+        ip_addrs = scan_ips
 
-        open_ports: list[int] = []
+    cached: dict[str, list[int]] = {}
+    if use_cache:
+        cached = {ip: ports for ip in ip_addrs if (ports := _cached_open_ports(ip)) is not None}
+    to_scan = [ip for ip in ip_addrs if ip not in cached]
+    scanned: dict[str, list[int]] = {}
+    if to_scan:
+        scanned = asyncio.run(_scan_all(to_scan, max_concurrency=max_workers, timeout=port_timeout))
+        _store_open_ports(scanned)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            results_iter = executor.map(lambda p: scan_port(p, ip, timeout=port_timeout), PORTS)
-
-        for port in results_iter:
-            if port:
-                open_ports.append(port)
+    for ip in ip_addrs:
+        if ip in cached:
+            open_ports = cached[ip]
+            success(f"Scanning {ip} ... (cached)")
+        else:
+            open_ports = scanned[ip]
+            success(f"Scanning {ip} ...")
 
         result["open_ports"][ip] = open_ports
 
@@ -113,11 +253,16 @@ def scan_target(target: str, *, max_workers: int = 100, port_timeout: float = 0.
     return result
 
 
-def main(target: str) -> dict[str, Any]:
-    return scan_target(target)
+def main(target: str, *, use_cache: bool = True, all_ips: bool = False) -> dict[str, Any]:
+    return scan_target(target, use_cache=use_cache, all_ips=all_ips)
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="TCP port scan (ports 1-1024)")
+    p.add_argument("target", help="Target host name or IPv4 address")
+    p.add_argument("--no-cache", action="store_true", help="Ignore cached results and scan again")
+    p.add_argument("--all-ips", action="store_true", help="Scan every resolved address, not one per /24")
+    return p.parse_args(argv)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        error("Please enter target", colored=False)
-        sys.exit(1)
-    main(sys.argv[1])
+    args = parse_args(sys.argv[1:])
+    main(args.target, use_cache=not args.no_cache, all_ips=args.all_ips)
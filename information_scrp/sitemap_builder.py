@@ -2,13 +2,17 @@
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+import functools
+import html
+import io
 import re
 import sys
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
-from collections import deque
+from requests.adapters import HTTPAdapter
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -19,83 +23,149 @@ from logging_utils import error, success
 # 제외할 키워드
 EXCLUDE_KEYWORDS = []   #["github", "linkedin", "facebook", "twitter", "instagram", "youtube", "javascript:", "google"]
 
-URL_PATTERN = re.compile(r'href=["\'](.*?)["\']', re.IGNORECASE)
+# 제외 키워드를 하나의 패턴으로 (키워드가 없으면 None: 빈 패턴은 모든 URL에 매칭됨)
+EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_KEYWORDS)), re.IGNORECASE) if EXCLUDE_KEYWORDS else None
+
+# href 값: 큰따옴표 / 작은따옴표 / 따옴표 없는 값 (각 분기가 닫는 문자까지 선형으로 매칭)
+URL_PATTERN = re.compile(r'(?<![\w-])href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'<>`]+))', re.IGNORECASE)
 
 output_file = "data/sitemap_tree.txt"
 
+POOL_SIZE = 16
+CHUNK_SIZE = 16384
+# 비정상적으로 큰 HTML은 앞부분만 링크 추출
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def normalize_url(url: str) -> str:
+    # 같은 페이지를 가리키는 URL 변형(대소문자 host, 기본 포트, fragment, 끝 '/', query 순서)을 하나로 통일
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port == DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(":", 1)[0]
+    path = parts.path.rstrip("/") or "/"
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
+
 def extract_urls(base_url: str, body: str):
     # HTML 바디에서 URL 추출 후 절대경로 변환
     found = []
-    for match in URL_PATTERN.findall(body):
-        if match.startswith("#") or match.startswith("javascript:") or match.startswith("mailto:"):
+    for m in URL_PATTERN.finditer(body):
+        match = html.unescape((m.group(1) or m.group(2) or m.group(3) or "").strip())
+        if not match or match.startswith(("#", "javascript:", "mailto:")):
             continue
         abs_url = urllib.parse.urljoin(base_url, match)
         # 필터링: 제외 키워드 포함된 URL은 건너뜀
-        if any(keyword.lower() in abs_url.lower() for keyword in EXCLUDE_KEYWORDS):
+        if EXCLUDE_RE and EXCLUDE_RE.search(abs_url):
             continue
         found.append(abs_url)
     return found
 
-def crawl(start_url: str, max_depth: int = 3, timeout: float = 5.0):
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    # 같은 depth의 페이지를 동시에 받으므로 worker 수만큼 keep-alive 연결 유지
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.verify = False
+    return session
+
+def _fetch(session: requests.Session, url: str, timeout: float) -> str | None:
+    # HTML 바디 반환, HTML이 아니거나 요청 실패 시 None
+    # stream: Content-Type 확인 전에는 바디를 받지 않음 (PDF, zip 등은 헤더만 보고 종료)
+    try:
+        with session.get(url, timeout=timeout, stream=True) as resp:
+            if "text/html" not in resp.headers.get("Content-Type", ""):
+                return None
+            body = bytearray()
+            for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                body += chunk
+                if len(body) >= MAX_BODY_BYTES:
+                    break
+            body = body[:MAX_BODY_BYTES]
+            try:
+                return body.decode(resp.encoding or "utf-8", errors="replace")
+            except LookupError:
+                # 알 수 없는 charset 라벨은 resp.text처럼 utf-8로 대체
+                return body.decode("utf-8", errors="replace")
+    except Exception as e:
+        error(f"Requests Failed: {url} ({e})")
+        return None
+
+def crawl(start_url: str, max_depth: int = 3, timeout: float = 5.0, max_workers: int = POOL_SIZE):
     # start_url부터 sitemap 탐색 (트리 구조 유지)
-    visited = set()
-    queue = deque([(start_url, 0, None)])  # (url, depth, parent)
+    # 중복 판단과 트리 key는 정규화된 URL, 요청과 상대경로 해석은 원래 URL 사용
+    # depth 단위로 BFS: 같은 depth의 페이지는 병렬로 받고, 결과는 순서대로 처리
+    start_key = normalize_url(start_url)
+    queued = {start_key}
+    level = [(start_url, start_key, None)]  # (url, key, parent key)
     tree = {}
+    # key -> 트리에서 해당 URL의 자식 dict (부모 경로를 따라 내려가지 않고 바로 삽입)
+    nodes = {}
+    depth = 0
+
+    with _create_session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while level:
+            to_fetch = []
+            for url, key, parent in level:
+                # 필터링: 제외 키워드 포함된 URL이면 스킵
+                if EXCLUDE_RE and EXCLUDE_RE.search(url):
+                    continue
+
+                # 트리 구조 삽입
+                nodes[key] = (nodes[parent] if parent else tree).setdefault(key, {})
+
+                if depth < max_depth:
+                    to_fetch.append((url, key))
+
+            bodies = executor.map(functools.partial(_fetch, session, timeout=timeout), [url for url, _ in to_fetch])
+            next_level = []
+            for (url, key), body in zip(to_fetch, bodies):
+                if body is None:
+                    continue
+                for new_url in extract_urls(url, body):
+                    new_key = normalize_url(new_url)
+                    if new_key not in queued:
+                        queued.add(new_key)
+                        next_level.append((new_url, new_key, key))
+
+            level = next_level
+            depth += 1
 
-    while queue:
-        url, depth, parent = queue.popleft()
-        if url in visited:
-            continue
-        # 필터링: 제외 키워드 포함된 URL이면 스킵
-        if any(keyword.lower() in url.lower() for keyword in EXCLUDE_KEYWORDS):
-            continue
-        visited.add(url)
-
-        # 트리 구조 삽입
-        node = tree
-        if parent:
-            for p in parent:
-                node = node.setdefault(p, {})
-            node = node.setdefault(url, {})
-        else:
-            node.setdefault(url, {})
-
-        if depth >= max_depth:
-            continue
-
-        try:
-            resp = requests.get(url, timeout=timeout, verify=False)
-            if "text/html" not in resp.headers.get("Content-Type", ""):
-                continue
-            body = resp.text
-        except Exception as e:
-            error(f"Requests Failed: {url} ({e})")
-            continue
+    return tree
 
-        for new_url in extract_urls(url, body):
-            if new_url not in visited:
-                queue.append((new_url, depth + 1, (parent or []) + [url]))
+def _tree_lines(tree: dict, prefix: str = ""):
+    """트리 구조를 한 줄씩 생성 (재귀 대신 명시적 stack, 깊은 트리에서도 RecursionError 없음)"""
+    # (url, children, prefix, is_last); 형제 순서를 유지하도록 역순으로 push
+    def _push(stack, node, prefix):
+        last = len(node) - 1
+        stack.extend((url, children, prefix, i == last) for i, (url, children) in reversed(list(enumerate(node.items()))))
 
-    return tree
+    stack = []
+    _push(stack, tree, prefix)
+    while stack:
+        url, children, prefix, is_last = stack.pop()
+        yield prefix + ("└── " if is_last else "├── ") + url
+        _push(stack, children, prefix + ("    " if is_last else "│   "))
 
 def print_tree(tree: dict, prefix: str = "", is_last: bool = True):
     """트리 구조 출력"""
-    for i, (url, children) in enumerate(tree.items()):
-        connector = "└── " if i == len(tree) - 1 else "├── "
-        print(prefix + connector + url)
-        new_prefix = prefix + ("    " if i == len(tree) - 1 else "│   ")
-        print_tree(children, new_prefix, i == len(tree) - 1)
+    for line in _tree_lines(tree, prefix):
+        print(line)
 
 def save_tree_to_txt(tree: dict, file_path: str, prefix: str = "", is_last: bool = True):
     """트리 구조를 텍스트 파일로 저장"""
-    with open(file_path, "w", encoding="utf-8") as f:
-        def _write_tree(node, prefix, is_last):
-            for i, (url, children) in enumerate(node.items()):
-                connector = "└── " if i == len(node) - 1 else "├── "
-                f.write(prefix + connector + url + "\n")
-                new_prefix = prefix + ("    " if i == len(node) - 1 else "│   ")
-                _write_tree(children, new_prefix, i == len(node) - 1)
-        _write_tree(tree, prefix, is_last)
+    # 줄 단위 write 대신 버퍼에 모은 뒤 한 번에 기록
+    buf = io.StringIO()
+    for line in _tree_lines(tree, prefix):
+        buf.write(line + "\n")
+    Path(file_path).write_text(buf.getvalue(), encoding="utf-8")
 
 def main(start_url: str,max_depth=100):
     tree = crawl(start_url, max_depth=max_depth)
@@ -1,6 +1,11 @@
+import gzip
+import json
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -14,6 +19,11 @@ from logging_utils import info, error
 TOTAL_TIMEOUT_SECONDS = 110
 SUBFINDER_TIMEOUT_SECONDS = 55
 HTTPX_TIMEOUT_SECONDS = 50
+SUBFINDER_CACHE_TTL_SECONDS = 3600
+# Write buffer for the URL list; lines are flushed in large blocks.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+CACHE_DIR = ROOT_DIR / "data" / "cache"
 
 
 def _extract_domain(target: str) -> str:
@@ -25,45 +35,130 @@ def _extract_domain(target: str) -> str:
         return (parsed.hostname or "").strip()
 
     # If user passed something like example.com/path, keep only host-ish part.
-    return value.split("/", 1)[0].strip()
-
+    return value.split("/", 1)[0].strip().lower()
 
-def _run_cmd(args: list[str], *, timeout_seconds: float, stdin_text: str | None = None) -> tuple[int, str, str]:
-    def _to_text(value: object) -> str:
-        if value is None:
-            return ""
-        if isinstance(value, bytes):
-            return value.decode(errors="replace")
-        return str(value)
 
+def _spawn(args: list[str], **kwargs) -> subprocess.Popen | None:
     try:
-        result = subprocess.run(
-            args,
-            input=stdin_text,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-            check=False,
-        )
-        return result.returncode, result.stdout or "", result.stderr or ""
+        return subprocess.Popen(args, text=True, errors="replace", **kwargs)
     except FileNotFoundError:
-        return 127, "", f"Command not found: {args[0]}"
-    except subprocess.TimeoutExpired as e:
-        stdout = _to_text(e.stdout)
-        stderr = _to_text(e.stderr)
-        return 124, stdout, f"Timeout after {timeout_seconds}s: {' '.join(args)}\n{stderr}".strip()
+        error(f"Command not found: {args[0]}", colored=False)
+        return None
+
+
+def _finish(proc: subprocess.Popen, args: list[str], timer: threading.Timer, stderr_file, timeout_seconds: float) -> int:
+    # Report like the old capture_output runner: timeouts always, stderr only on failure.
+    code = proc.wait()
+    # finished is only set before cancel() if the timer fired and killed the process.
+    timed_out = timer.finished.is_set() and code != 0
+    timer.cancel()
+    stderr_file.seek(0)
+    err = stderr_file.read().strip()
+    stderr_file.close()
+    if timed_out:
+        error(f"Timeout after {timeout_seconds:.0f}s: {' '.join(args)}\n{err}".strip(), colored=False)
+        return 124
+    if code != 0 and err:
+        error(err, colored=False)
+    return code
+
+
+def _stream_subfinder(domain: str, timeout_seconds: float, status: dict[str, int]) -> Iterator[str]:
+    # Yields hosts as subfinder prints them (stripped, lowercased, deduped), so
+    # httpx can probe them while enumeration is still running.
+    args = ["subfinder", "-silent", "-d", domain]
+    stderr_file = tempfile.TemporaryFile(mode="w+t", errors="replace")
+    proc = _spawn(args, stdout=subprocess.PIPE, stderr=stderr_file)
+    if proc is None:
+        stderr_file.close()
+        status["code"] = 127
+        return
+    timer = threading.Timer(timeout_seconds, proc.kill)
+    timer.start()
+    seen: set[str] = set()
+    for line in proc.stdout:
+        host = line.strip().lower()
+        if host and host not in seen:
+            seen.add(host)
+            yield host
+    status["code"] = _finish(proc, args, timer, stderr_file, timeout_seconds)
+
+
+def _run_httpx(hosts: Iterable[str], *, timeout_seconds: float) -> list[str]:
+    # Hosts are written to httpx's stdin as they arrive (from a list or straight
+    # from subfinder) and its output is handled line by line as it is printed.
+    args = ["httpx", "-silent", "-probe", "-title", "-status-code"]
+    stderr_file = tempfile.TemporaryFile(mode="w+t", errors="replace")
+    proc = _spawn(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr_file)
+    if proc is None:
+        stderr_file.close()
+        for _ in hosts:
+            pass  # Still drain the source so subfinder results are collected.
+        return []
+
+    def _feed() -> None:
+        try:
+            for host in hosts:
+                proc.stdin.write(host + "\n")
+                proc.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            for _ in hosts:
+                pass  # httpx exited early; keep collecting the source.
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    feeder = threading.Thread(target=_feed, daemon=True)
+    feeder.start()
+    timer = threading.Timer(timeout_seconds, proc.kill)
+    timer.start()
+
+    urls: list[str] = []
+    for line in proc.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        # Preserve dashboard logs.
+        print(line)
+        urls.append(line.split(" ", 1)[0])
+
+    _finish(proc, args, timer, stderr_file, timeout_seconds)
+    feeder.join()
+    return urls
 
 
 def _dedupe_keep_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for v in values:
-        item = (v or "").strip()
-        if not item or item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+    # dict keeps insertion order, so fromkeys dedupes in C with first-seen order.
+    return list(dict.fromkeys(filter(None, ((v or "").strip() for v in values))))
+
+
+def _cache_path(domain: str) -> Path:
+    return CACHE_DIR / f"subfinder_{domain}.json.gz"
+
+
+def _load_cached_subdomains(domain: str) -> list[str] | None:
+    # Passive enumeration results barely change within an hour; reuse them on reruns.
+    path = _cache_path(domain)
+    try:
+        if time.time() - path.stat().st_mtime > SUBFINDER_CACHE_TTL_SECONDS:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return [str(v) for v in data] if isinstance(data, list) else None
+
+
+def _save_cached_subdomains(domain: str, subdomains: list[str]) -> None:
+    path = _cache_path(domain)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(subdomains, f)
+    except OSError as exc:
+        error(f"Could not write subfinder cache: {exc}", colored=False)
 
 
 def main(target: str) -> None:
@@ -74,62 +169,42 @@ def main(target: str) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     start = time.monotonic()
-    subdomains: list[str] = []
+    urls: list[str] = []
 
     if not domain:
         error("Invalid target domain.", colored=False)
+        error("No targets to probe with httpx.", colored=False)
     else:
-        remaining = max(1.0, TOTAL_TIMEOUT_SECONDS - (time.monotonic() - start))
-        subfinder_timeout = min(SUBFINDER_TIMEOUT_SECONDS, remaining)
-
-        # No stdin piping: pass domain via -d/-domain argument.
-        code, out, err = _run_cmd(
-            ["subfinder", "-silent", "-d", domain],
-            timeout_seconds=subfinder_timeout,
-        )
-        if code not in (0,):
-            if err.strip():
-                error(err.strip(), colored=False)
-        subdomains = [line.strip() for line in out.splitlines() if line.strip()]
-
-        if not subdomains:
-            error("No subdomains found.", colored=False)
-
-    targets_for_httpx = _dedupe_keep_order([domain, *subdomains] if domain else subdomains)
-
-    urls: list[str] = []
-    if domain:
         urls.extend([f"https://{domain}/", f"http://{domain}/"])
+        httpx_timeout = min(HTTPX_TIMEOUT_SECONDS, TOTAL_TIMEOUT_SECONDS)
 
-    if targets_for_httpx:
-        remaining = TOTAL_TIMEOUT_SECONDS - (time.monotonic() - start)
-        if remaining <= 1:
-            error(f"Skipping httpx: overall timeout budget exceeded ({TOTAL_TIMEOUT_SECONDS}s).", colored=False)
+        cached = _load_cached_subdomains(domain)
+        if cached is not None:
+            info(f"Using cached subfinder results for {domain} ({len(cached)} entries)")
+            urls.extend(_run_httpx(list(dict.fromkeys([domain, *cached])), timeout_seconds=httpx_timeout))
         else:
-            httpx_timeout = min(HTTPX_TIMEOUT_SECONDS, remaining)
-            stdin_text = "\n".join(targets_for_httpx) + "\n"
-            code, out, err = _run_cmd(
-                ["httpx", "-silent", "-probe", "-title", "-status-code"],
-                timeout_seconds=httpx_timeout,
-                stdin_text=stdin_text,
-            )
-
-            if err.strip() and code not in (0,):
-                error(err.strip(), colored=False)
-
-            for line in (out or "").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                # Preserve dashboard logs.
-                print(line)
-                urls.append(line.split(" ", 1)[0])
-
-    if not targets_for_httpx:
-        error("No targets to probe with httpx.", colored=False)
+            # subfinder's output is piped into httpx as it is produced, so both
+            # run at the same time and share the overall budget.
+            subdomains: list[str] = []
+            status: dict[str, int] = {}
+
+            def _hosts() -> Iterator[str]:
+                yield domain
+                for host in _stream_subfinder(domain, SUBFINDER_TIMEOUT_SECONDS, status):
+                    subdomains.append(host)
+                    if host != domain:
+                        yield host
+
+            httpx_timeout = max(1.0, TOTAL_TIMEOUT_SECONDS - (time.monotonic() - start))
+            urls.extend(_run_httpx(_hosts(), timeout_seconds=httpx_timeout))
+
+            if not subdomains:
+                error("No subdomains found.", colored=False)
+            elif status.get("code") == 0:
+                _save_cached_subdomains(domain, subdomains)
 
     urls = _dedupe_keep_order(urls)
-    with open(output_path, "w", encoding="utf-8") as f:
+    with open(output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
         for url in urls:
             f.write(url + "\n")
 
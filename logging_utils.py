@@ -1,6 +1,10 @@
-GREEN = "\033[32m"
-RED = "\033[31m"
-RESET = "\033[0m"
+import sys
+
+# Skip ANSI escapes when stdout is redirected (files, pipes, grep).
+_TTY = sys.stdout.isatty()
+GREEN = "\033[32m" if _TTY else ""
+RED = "\033[31m" if _TTY else ""
+RESET = "\033[0m" if _TTY else ""
 
 
 def info(message: str) -> None:
@@ -1,32 +1,51 @@
+import functools
+import itertools
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
+from typing import Callable, Iterable, TextIO
 from urllib.parse import urlparse
 
 from information_scrp import important_search, major_dir_file, cookie_scan, port_scan
 
 
-def read_targets(file_path: str) -> list[str]:
-    with open(file_path, "r") as f:
-        raw = [line.strip() for line in f if line.strip()]
+# Characters that make urlparse split off a path/query/fragment, strip input or
+# validate an IPv6 literal; targets containing them take the full parse.
+_URL_DELIMITERS = frozenset("/?#;[]\\\t\r\n")
+
 
+def read_targets(file_path: str) -> list[str]:
     def _canonicalize(value: str) -> str:
-        parsed = urlparse(normalize_url(value))
+        url = normalize_url(value)
+        # Fast path: "host[:port]" with at most a trailing "/" is already
+        # canonical, so skip urlparse/geturl for the common bare-host lines.
+        start = url.index("://") + 3
+        authority = url[start:-1] if url.endswith("/") and len(url) > start else url[start:]
+        if not _URL_DELIMITERS.intersection(authority):
+            return url[:start] + authority
+        parsed = urlparse(url)
         # Treat a bare root path as equivalent ("https://a/" -> "https://a").
         path = "" if parsed.path == "/" else (parsed.path or "")
         return parsed._replace(path=path).geturl()
 
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in raw:
-        canon = _canonicalize(value)
-        if canon in seen:
-            continue
-        seen.add(canon)
-        out.append(canon)
-    return out
+    # Single streaming pass; dict keeps first-seen order. Repeated lines are
+    # skipped before they are canonicalized, and the canonical URL itself is
+    # the dedup key.
+    seen_lines: set[str] = set()
+    out: dict[str, None] = {}
+    with open(file_path, "r") as f:
+        for line in f:
+            value = line.strip()
+            if not value or value in seen_lines:
+                continue
+            seen_lines.add(value)
+            out[_canonicalize(value)] = None
+    return list(out)
 
 
 def normalize_url(value: str) -> str:
@@ -35,13 +54,25 @@ def normalize_url(value: str) -> str:
     return f"http://{value}"
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_host(value: str) -> str:
+    # Called for the same target by main_process, the port scan and the report.
     parsed = urlparse(normalize_url(value))
     return parsed.hostname or value
 
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data"
 
+# Targets scanned at the same time. Each one already fans out its own probes
+# (32 dir/file workers), so this stays small.
+TARGET_WORKERS = 8
+# Write buffer for the HTML report; fragments are flushed in large blocks.
+REPORT_BUFFER_SIZE = 1 << 20
+# Port scans run one at a time: a single scan already keeps up to
+# port_scan.MAX_CONCURRENCY sockets open, and hosts shared by several targets
+# must hit port_scan_cache instead of being scanned twice concurrently.
+_PORT_SCAN_LOCK = threading.Lock()
+
 
 def action_major_dir_file(url: str) -> dict:
     return major_dir_file.main(url)
@@ -59,15 +90,41 @@ def action_cookie_scan(url: str) -> dict:
     cookies, mfa = cookie_scan.scan_and_render(url)
     return {
         "url": url,
-        "cookies": cookies,
+        "cookies": [asdict(c) for c in cookies],
         "mfa_detected": mfa,
     }
 
 
-def _write_json(path: Path, data: object) -> None:
+# Per-target keys that also get their own per-tool JSON file.
+TOOL_KEYS = ("major_dir_file", "important_search", "port_scan", "cookie_scan")
+
+
+def _dumps(data: object) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+# Helpers to assemble _dumps() output from already-encoded members. Encoded
+# strings escape newlines, so every raw "\n" is layout and can be re-indented.
+def _nest(text: str) -> str:
+    return text.replace("\n", "\n  ")
+
+
+def _dumps_encoded_list(items: list[str]) -> str:
+    if not items:
+        return "[]"
+    return "[\n  " + ",\n  ".join(map(_nest, items)) + "\n]"
+
+
+def _dumps_encoded_dict(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",\n  ".join(f"{_dumps(key)}: {_nest(value)}" for key, value in pairs)
+    return "{\n  " + body + "\n}" if body else "{}"
+
+
+def _write_json(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode in memory and write once; json.dump would issue a write() per token.
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(text)
 
 
 def _read_text_if_exists(path: Path, *, max_chars: int = 200_000) -> str | None:
@@ -79,25 +136,7 @@ def _read_text_if_exists(path: Path, *, max_chars: int = 200_000) -> str | None:
     return content
 
 
-def _render_table(headers: list[str], rows: list[list[str]]) -> str:
-    if not rows:
-        return "<p class='muted'>No results.</p>"
-    parts: list[str] = []
-    parts.append("<div class='table-wrap'><table>")
-    parts.append("<thead><tr>" + "".join(f"<th>{escape(h)}</th>" for h in headers) + "</tr></thead>")
-    parts.append("<tbody>")
-    for row in rows:
-        parts.append("<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>")
-    parts.append("</tbody></table></div>")
-    return "".join(parts)
-
-
-def _render_html_report(report: dict) -> str:
-    generated_at = str(report.get("generated_at") or "")
-    targets = report.get("targets") or []
-    per_target = report.get("per_target") or []
-
-    css = """
+_REPORT_CSS = """
 :root {
   --bg0: #0b0f19;
   --bg1: #0f172a;
@@ -196,166 +235,235 @@ pre {
 }
 """
 
-    parts: list[str] = []
-    parts.append("<!doctype html><html><head><meta charset='utf-8'>")
-    parts.append("<meta name='viewport' content='width=device-width, initial-scale=1'>")
-    parts.append("<title>VCLAS Results</title>")
-    parts.append(f"<style>{css}</style></head><body>")
+# Static document head, built once at import.
+_REPORT_HEAD = (
+    "<!doctype html><html><head><meta charset='utf-8'>"
+    "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+    "<title>VCLAS Results</title>"
+    f"<style>{_REPORT_CSS}</style></head><body>"
+)
+
+# Per-target <details> opener and summary badge.
+_DETAILS_TMPL = "<details><summary>{title}{badges}</summary>"
+_BADGE_TMPL = "<span class='badge'>{}</span>"
+
+# Table headers and cells repeat a lot (categories, statuses, IPs, "yes"/"no");
+# escape each distinct value once.
+_esc = functools.lru_cache(maxsize=8192)(escape)
+
+
+def _badge_value(value) -> str:
+    # Integers render as-is; anything else came from outside and is escaped.
+    return str(value) if type(value) is int else _esc(str(value))
+
+
+def _section_targets(per_target: list[dict], key: str, has_data: Callable[[dict], object]) -> list[dict]:
+    # All targets, or none when no target has anything to show in this section.
+    if any(has_data(item.get(key) or {}) for item in per_target):
+        return per_target
+    return []
+
+
+def _render_table(write: Callable[[str], object], headers: list[str], rows: Iterable[Iterable[str]]) -> None:
+    # Writes straight into the report's sink; no per-row strings are built.
+    # rows may be a generator: cells are escaped and written as they are produced.
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        write("<p class='muted'>No results.</p>")
+        return
+    write("<div class='table-wrap'><table><thead><tr>")
+    for h in headers:
+        write("<th>")
+        write(_esc(h))
+        write("</th>")
+    write("</tr></thead><tbody>")
+    for row in itertools.chain((first,), rows):
+        write("<tr>")
+        for cell in row:
+            write("<td>")
+            write(_esc(cell))
+            write("</td>")
+        write("</tr>")
+    write("</tbody></table></div>")
+
+
+def _stream_html_report(report: dict, fp: TextIO) -> None:
+    # Fragments go to the (buffered) file as they are produced instead of being
+    # collected and joined into one document string first.
+    generated_at = str(report.get("generated_at") or "")
+    targets = report.get("targets") or []
+    per_target = report.get("per_target") or []
 
-    parts.append("<header>")
-    parts.append("<h1>Vuln-Checklist-AutoScript Results</h1>")
-    parts.append(f"<div class='meta'>Generated at: <code>{escape(generated_at)}</code></div>")
-    parts.append("</header>")
+    write = fp.write
+    write(_REPORT_HEAD)
 
-    parts.append("<main>")
-    parts.append("<div class='grid'>")
-    parts.append(f"<div class='kpi'><div class='label'>Targets</div><div class='value'>{len(targets)}</div></div>")
-    parts.append(f"<div class='kpi'><div class='label'>Sections</div><div class='value'>5</div></div>")
-    parts.append(f"<div class='kpi'><div class='label'>Targets File</div><div class='value'><code>{escape(str(report.get('targets_path') or ''))}</code></div></div>")
-    parts.append("</div>")
+    write("<header>")
+    write("<h1>Vuln-Checklist-AutoScript Results</h1>")
+    write(f"<div class='meta'>Generated at: <code>{escape(generated_at)}</code></div>")
+    write("</header>")
+
+    write("<main>")
+    write("<div class='grid'>")
+    write(f"<div class='kpi'><div class='label'>Targets</div><div class='value'>{len(targets)}</div></div>")
+    write(f"<div class='kpi'><div class='label'>Sections</div><div class='value'>5</div></div>")
+    write(f"<div class='kpi'><div class='label'>Targets File</div><div class='value'><code>{escape(str(report.get('targets_path') or ''))}</code></div></div>")
+    write("</div>")
 
     # Subdomains / Targets
-    parts.append("<section id='subdomains'>")
-    parts.append(f"<h2>Subdomains / Targets <span class='badge'>{len(targets)}</span></h2>")
+    write("<section id='subdomains'>")
+    write(f"<h2>Subdomains / Targets <span class='badge'>{len(targets)}</span></h2>")
     if targets:
-        rows = [[t] for t in targets]
-        parts.append(_render_table(["target"], rows))
+        _render_table(write, ["target"], ((t,) for t in targets))
     else:
-        parts.append("<p class='muted'>No targets.</p>")
-    parts.append("</section>")
+        write("<p class='muted'>No targets.</p>")
+    write("</section>")
 
     # Major Dir/File
-    parts.append("<section id='major-dir-file'>")
-    parts.append("<h2>Major Dir/File</h2>")
-    for item in per_target:
+    write("<section id='major-dir-file'><h2>Major Dir/File</h2>")
+    major_targets = _section_targets(per_target, "major_dir_file", lambda m: m.get("skipped") or m.get("catch_all") is not None or any(
+        c.get("found") or c.get("errors") for c in m.get("categories") or []
+    ))
+    for item in major_targets:
         url = str(item.get("url") or item.get("target") or "")
         major = item.get("major_dir_file") or {}
         categories = major.get("categories") or []
 
-        found_rows: list[list[str]] = []
-        error_count = 0
-        for cat in categories:
-            cat_name = str(cat.get("category") or "")
-            found = cat.get("found") or []
-            errs = cat.get("errors") or []
-            error_count += len(errs)
-            for entry in found:
-                found_rows.append([
-                    cat_name,
-                    str(entry.get("path") or ""),
-                    str(entry.get("url") or ""),
-                    str(entry.get("status_code") or ""),
-                ])
+        found_count = sum(len(cat.get("found") or []) for cat in categories)
+        error_count = sum(len(cat.get("errors") or []) for cat in categories)
+        found_rows = (
+            (
+                str(cat.get("category") or ""),
+                str(entry.get("path") or ""),
+                str(entry.get("url") or ""),
+                str(entry.get("status_code") or ""),
+            )
+            for cat in categories
+            for entry in cat.get("found") or []
+        )
 
         summary = f"{url}"
+        # Counts and status codes are plain integers; only foreign values need escaping.
         badges = []
-        if found_rows:
-            badges.append(f"found: {len(found_rows)}")
+        if found_count:
+            badges.append(f"found: {found_count}")
         if error_count:
             badges.append(f"errors: {error_count}")
-        badge_str = "".join(f"<span class='badge'>{escape(b)}</span>" for b in badges)
-
-        parts.append("<details>")
-        parts.append(f"<summary>{escape(summary)}{badge_str}</summary>")
-        parts.append(_render_table(["category", "path", "url", "status"], found_rows))
-        parts.append("</details>")
-    parts.append("</section>")
+        catch_all = major.get("catch_all")
+        if catch_all is not None:
+            badges.append(f"catch-all: {_badge_value(catch_all)}")
+        badge_str = "".join(_BADGE_TMPL.format(b) for b in badges)
+
+        write(_DETAILS_TMPL.format_map({"title": escape(summary), "badges": badge_str}))
+        if major.get("skipped"):
+            write(f"<p class='muted'>{escape(str(major['skipped']))}</p>")
+        _render_table(write, ["category", "path", "url", "status"], found_rows)
+        write("</details>")
+    if not major_targets:
+        write("<p class='muted'>No results.</p>")
+    write("</section>")
 
     # Important Search
-    parts.append("<section id='important-search'>")
-    parts.append("<h2>Important Search</h2>")
-    for item in per_target:
+    write("<section id='important-search'><h2>Important Search</h2>")
+    important_targets = _section_targets(per_target, "important_search", lambda i: i.get("status_code") is not None or i.get("header_infos") or i.get("exposures"))
+    for item in important_targets:
         url = str(item.get("url") or item.get("target") or "")
         imp = item.get("important_search") or {}
         status = imp.get("status_code")
         header_infos = imp.get("header_infos") or []
         exposures = imp.get("exposures") or {}
 
-        exposure_rows: list[list[str]] = []
-        for name, matches in exposures.items():
-            matches_list = matches if isinstance(matches, list) else []
-            sample = ", ".join(str(m) for m in matches_list[:5])
-            exposure_rows.append([str(name), str(len(matches_list)), sample])
-
-        header_rows: list[list[str]] = []
-        for hi in header_infos:
-            header_rows.append([
+        exposure_rows = (
+            (str(name), str(len(matches_list)), ", ".join(str(m) for m in matches_list[:5]))
+            for name, matches in exposures.items()
+            for matches_list in (matches if isinstance(matches, list) else [],)
+        )
+        header_rows = (
+            (
                 str(hi.get("header") or ""),
                 str(hi.get("value") or ""),
                 ", ".join(str(v) for v in (hi.get("versions") or [])),
-            ])
-
-        badge_str = f"<span class='badge'>status: {escape(str(status))}</span>" if status is not None else ""
-        parts.append("<details>")
-        parts.append(f"<summary>{escape(url)}{badge_str}</summary>")
-        parts.append("<h3 class='muted'>Header Info</h3>")
-        parts.append(_render_table(["header", "value", "versions"], header_rows))
-        parts.append("<h3 class='muted'>Exposures</h3>")
-        parts.append(_render_table(["type", "count", "sample"], exposure_rows))
-        parts.append("</details>")
-    parts.append("</section>")
+            )
+            for hi in header_infos
+        )
+
+        badge_str = _BADGE_TMPL.format(f"status: {_badge_value(status)}") if status is not None else ""
+        write(_DETAILS_TMPL.format_map({"title": escape(url), "badges": badge_str}))
+        write("<h3 class='muted'>Header Info</h3>")
+        _render_table(write, ["header", "value", "versions"], header_rows)
+        write("<h3 class='muted'>Exposures</h3>")
+        _render_table(write, ["type", "count", "sample"], exposure_rows)
+        write("</details>")
+    if not important_targets:
+        write("<p class='muted'>No results.</p>")
+    write("</section>")
 
     # Port Scan
-    parts.append("<section id='port-scan'>")
-    parts.append("<h2>Port Scan</h2>")
-    for item in per_target:
+    write("<section id='port-scan'><h2>Port Scan</h2>")
+    port_targets = _section_targets(per_target, "port_scan", lambda p: p.get("ip_addresses"))
+    for item in port_targets:
         host = str(item.get("host") or extract_host(str(item.get("url") or "")))
         port = item.get("port_scan") or {}
         ip_addrs = port.get("ip_addresses") or []
         open_ports = port.get("open_ports") or {}
-        port_rows: list[list[str]] = []
-        for ip in ip_addrs:
-            ports = open_ports.get(ip) or []
-            port_rows.append([str(ip), ", ".join(str(p) for p in ports) if ports else "-"])
-        parts.append("<details>")
-        parts.append(f"<summary>{escape(host)}<span class='badge'>ips: {len(ip_addrs)}</span></summary>")
-        parts.append(_render_table(["ip", "open_ports"], port_rows))
-        parts.append("</details>")
-    parts.append("</section>")
+        # Addresses missing from open_ports share a /24 with a scanned one (see port_scan --all-ips).
+        port_rows = (
+            (str(ip), "not scanned" if ip not in open_ports else ", ".join(str(p) for p in open_ports[ip] or ()) or "-")
+            for ip in ip_addrs
+        )
+        write(_DETAILS_TMPL.format_map({"title": escape(host), "badges": _BADGE_TMPL.format(f"ips: {len(ip_addrs)}")}))
+        _render_table(write, ["ip", "open_ports"], port_rows)
+        write("</details>")
+    if not port_targets:
+        write("<p class='muted'>No results.</p>")
+    write("</section>")
 
     # Cookie Scan
-    parts.append("<section id='cookie-scan'>")
-    parts.append("<h2>Cookie & MFA</h2>")
-    for item in per_target:
+    write("<section id='cookie-scan'><h2>Cookie & MFA</h2>")
+    cookie_targets = _section_targets(per_target, "cookie_scan", lambda c: c.get("cookies") or c.get("mfa_detected"))
+    for item in cookie_targets:
         url = str(item.get("url") or item.get("target") or "")
         cs = item.get("cookie_scan") or {}
         cookies = cs.get("cookies") or []
         mfa = bool(cs.get("mfa_detected"))
-        cookie_rows: list[list[str]] = []
-        for c in cookies:
-            cookie_rows.append([
+        cookie_rows = (
+            (
                 str(c.get("name") or ""),
                 str(c.get("value") or ""),
                 str(c.get("raw_header") or ""),
-            ])
-        parts.append("<details>")
-        parts.append(
-            f"<summary>{escape(url)}<span class='badge'>cookies: {len(cookies)}</span><span class='badge'>mfa: {'yes' if mfa else 'no'}</span></summary>"
+                "yes" if c.get("secure") else "no",
+                "yes" if c.get("httponly") else "no",
+                str(c.get("samesite") or ""),
+            )
+            for c in cookies
         )
-        parts.append(_render_table(["name", "value", "raw_header"], cookie_rows))
-        parts.append("</details>")
-    parts.append("</section>")
+        badge_str = _BADGE_TMPL.format(f"cookies: {len(cookies)}") + _BADGE_TMPL.format(f"mfa: {'yes' if mfa else 'no'}")
+        write(_DETAILS_TMPL.format_map({"title": escape(url), "badges": badge_str}))
+        _render_table(write, ["name", "value", "raw_header", "secure", "httponly", "samesite"], cookie_rows)
+        write("</details>")
+    if not cookie_targets:
+        write("<p class='muted'>No results.</p>")
+    write("</section>")
 
     # Optional sitemap tree
     sitemap_text = report.get("sitemap_tree")
     if isinstance(sitemap_text, str) and sitemap_text.strip():
-        parts.append("<section id='sitemap'>")
-        parts.append("<h2>Sitemap Tree</h2>")
-        parts.append(f"<pre>{escape(sitemap_text)}</pre>")
-        parts.append("</section>")
+        write("<section id='sitemap'>")
+        write("<h2>Sitemap Tree</h2>")
+        write(f"<pre>{escape(sitemap_text)}</pre>")
+        write("</section>")
 
-    parts.append("</main></body></html>")
-    return "".join(parts)
+    write("</main></body></html>")
 
 
 def main(targets_path: str) -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     targets = read_targets(targets_path)
-    per_target: list[dict] = []
     port_scan_cache: dict[str, dict] = {}
-    for target in targets:
-        per_target.append(main_process(target, port_scan_cache=port_scan_cache))
+    # Network-bound: scan targets concurrently; map keeps the input order.
+    with ThreadPoolExecutor(max_workers=max(1, min(TARGET_WORKERS, len(targets)))) as executor:
+        per_target = list(executor.map(functools.partial(main_process, port_scan_cache=port_scan_cache), targets))
 
     report = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -365,30 +473,60 @@ def main(targets_path: str) -> None:
         "sitemap_tree": _read_text_if_exists(DATA_DIR / "sitemap_tree.txt"),
     }
 
-    _write_json(DATA_DIR / "results.json", report)
-    (DATA_DIR / "results.html").write_text(_render_html_report(report), encoding="utf-8")
-
-    # Convenience per-tool JSON files for dashboard sections.
-    _write_json(DATA_DIR / "subdomains.json", {"targets": targets})
-    _write_json(DATA_DIR / "major_dir_file.json", [t.get("major_dir_file") for t in per_target])
-    _write_json(DATA_DIR / "important_search.json", [t.get("important_search") for t in per_target])
-    _write_json(DATA_DIR / "port_scan.json", [t.get("port_scan") for t in per_target])
-    _write_json(DATA_DIR / "cookie_scan.json", [t.get("cookie_scan") for t in per_target])
+    # Encode each tool result once; results.json and the per-tool files are
+    # both assembled from these fragments.
+    encoded_tools = {key: [_dumps(t.get(key)) for t in per_target] for key in TOOL_KEYS}
+    encoded_targets = [
+        _dumps_encoded_dict(
+            (key, encoded_tools[key][i] if key in encoded_tools else _dumps(value))
+            for key, value in t.items()
+        )
+        for i, t in enumerate(per_target)
+    ]
+    _write_json(
+        DATA_DIR / "results.json",
+        _dumps_encoded_dict(
+            (key, _dumps_encoded_list(encoded_targets) if key == "per_target" else _dumps(value))
+            for key, value in report.items()
+        ),
+    )
+    with open(DATA_DIR / "results.html", "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        _stream_html_report(report, f)
+
+    # Convenience per-tool JSON files for dashboard sections. They are
+    # independent files, so write them side by side.
+    per_tool_files = {"subdomains.json": _dumps({"targets": targets})}
+    per_tool_files.update((f"{key}.json", _dumps_encoded_list(encoded_tools[key])) for key in TOOL_KEYS)
+    with ThreadPoolExecutor(max_workers=len(per_tool_files)) as executor:
+        for future in [executor.submit(_write_json, DATA_DIR / name, text) for name, text in per_tool_files.items()]:
+            future.result()
+
+
+def _port_scan_cached(url: str, host: str, port_scan_cache: dict[str, dict] | None) -> dict:
+    with _PORT_SCAN_LOCK:
+        if port_scan_cache is not None and host in port_scan_cache:
+            return port_scan_cache[host]
+        port = action_port_scan(url)
+        if port_scan_cache is not None:
+            port_scan_cache[host] = port
+        return port
 
 
 def main_process(target: str, *, port_scan_cache: dict[str, dict] | None = None) -> dict:
     url = normalize_url(target)
-
-    major = action_major_dir_file(url)
-    imp = action_important_search(url)
     host = extract_host(url)
-    if port_scan_cache is not None and host in port_scan_cache:
-        port = port_scan_cache[host]
-    else:
-        port = action_port_scan(url)
-        if port_scan_cache is not None:
-            port_scan_cache[host] = port
-    cookie = action_cookie_scan(url)
+
+    # The four tools are independent network jobs; run them side by side so a
+    # target takes as long as its slowest tool, not the sum of all four.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        major_future = executor.submit(action_major_dir_file, url)
+        imp_future = executor.submit(action_important_search, url)
+        port_future = executor.submit(_port_scan_cached, url, host, port_scan_cache)
+        cookie_future = executor.submit(action_cookie_scan, url)
+        major = major_future.result()
+        imp = imp_future.result()
+        port = port_future.result()
+        cookie = cookie_future.result()
 
     return {
         "target": target,
@@ -0,0 +1,81 @@
+import http.server
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from information_scrp import major_dir_file
+
+PATHS = {"misc": ["robots.txt", "admin/", "backup.sql"]}
+
+
+def _serve(answer):
+    # answer(path) -> (status, headers); the server lives until the test ends.
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_HEAD(self):
+            status, headers = answer(self.path)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def site():
+    # Answers robots.txt and admin/ (-> login); everything else is a 404.
+    def answer(path):
+        if path == "/robots.txt":
+            return 200, {}
+        if path == "/admin/":
+            return 302, {"Location": "/login"}
+        return 404, {}
+
+    server, url = _serve(answer)
+    yield url
+    server.shutdown()
+
+
+def _found(result):
+    return {(f["path"], f["status_code"]) for c in result["categories"] for f in c["found"]}
+
+
+def test_redirect_everything_host_is_judged_by_redirect_target(site):
+    # Every path 301s to the same path on another host, like http -> https.
+    server, url = _serve(lambda path: (301, {"Location": site + path}))
+    try:
+        result = major_dir_file.scan(url + "/", PATHS, timeout=2)
+    finally:
+        server.shutdown()
+    assert result["catch_all"] is None
+    assert _found(result) == {("robots.txt", 200), ("admin/", 302)}
+
+
+def test_direct_scan_counts_other_path_redirects(site):
+    result = major_dir_file.scan(site + "/", PATHS, timeout=2)
+    assert _found(result) == {("robots.txt", 200), ("admin/", 302)}
+
+
+def test_redirect_every_path_to_login_is_catch_all():
+    server, url = _serve(lambda path: (200, {}) if path == "/login" else (302, {"Location": "/login"}))
+    try:
+        result = major_dir_file.scan(url + "/", PATHS, timeout=2)
+    finally:
+        server.shutdown()
+    assert result["catch_all"] == 302
+    assert "catch-all" in result["skipped"]
+    assert _found(result) == set()